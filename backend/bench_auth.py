@@ -0,0 +1,69 @@
+"""Load benchmark for token auth.
+
+Run from the backend directory:
+    python bench_auth.py --requests 20000 --users 200 --threads 8
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+os.environ.setdefault("USER_DB_PATH", os.path.join(tempfile.mkdtemp(), "bench_users.db"))
+
+from security import (  # noqa: E402
+    create_access_token,
+    hash_password,
+    token_cache,
+    verify_access_token,
+    verify_password,
+)
+from user_store import get_user_store  # noqa: E402
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return (time.perf_counter() - start) * 1e6
+
+
+def report(label, samples):
+    samples = sorted(samples)
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    print(f"{label:<28} n={len(samples):<7} mean={statistics.mean(samples):9.1f}us "
+          f"p50={statistics.median(samples):9.1f}us p99={p99:9.1f}us")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    store = get_user_store()
+    password_hash = hash_password("secret")
+    for i in range(args.users):
+        store.add_user(f"user{i}", password_hash)
+
+    tokens = [create_access_token(f"user{i}") for i in range(args.users)]
+    report("bcrypt verify (login)", [timed(verify_password, "secret", password_hash) for _ in range(20)])
+    report("user lookup (pooled sqlite)",
+           [timed(store.get_password_hash, f"user{i % args.users}") for i in range(args.requests)])
+
+    token_cache.clear()
+    report("token verify (cold)", [timed(verify_access_token, t) for t in tokens])
+
+    with ThreadPoolExecutor(args.threads) as pool:
+        start = time.perf_counter()
+        samples = list(pool.map(lambda i: timed(verify_access_token, tokens[i % len(tokens)]),
+                                range(args.requests)))
+        elapsed = time.perf_counter() - start
+    report("token verify (cached)", samples)
+    print(f"cached throughput: {args.requests / elapsed:,.0f} verifications/s on {args.threads} threads")
+
+
+if __name__ == "__main__":
+    main()
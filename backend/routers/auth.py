@@ -1,11 +1,65 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Form, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer, OAuth2PasswordRequestForm
+
+from security import (
+    InvalidTokenError,
+    create_access_token,
+    hash_password,
+    verify_access_token,
+    verify_password,
+)
+from user_store import UserExistsError, get_user_store
 
 router = APIRouter()
+bearer_scheme = HTTPBearer()
+
+
+def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme)):
+    """Dependency for protected routes, e.g. forecast and export endpoints."""
+    try:
+        claims = verify_access_token(credentials.credentials)
+    except InvalidTokenError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return claims["sub"]
+
 
 @router.post("/register")
-def register(username: str, password: str):
+async def register(username: str = Form(...), password: str = Form(...)):
+    # Form fields rather than query parameters keep credentials out of access logs.
+    # bcrypt is deliberately slow; keep it off the event loop
+    password_hash = await run_in_threadpool(hash_password, password)
+    try:
+        await run_in_threadpool(get_user_store().add_user, username, password_hash)
+    except UserExistsError:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Username already exists.")
     return {"message": f"User {username} registered successfully."}
 
+
 @router.post("/login")
-def login(username: str, password: str):
-    return {"message": f"User {username} logged in successfully."}
+async def login(form: OAuth2PasswordRequestForm = Depends()):
+    username = form.username
+    store = get_user_store()
+    password_hash = await run_in_threadpool(store.get_password_hash, username)
+    valid, new_hash = await run_in_threadpool(verify_password, form.password, password_hash)
+    if not valid:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect username or password.",
+        )
+    if new_hash:
+        await run_in_threadpool(store.update_password_hash, username, new_hash)
+    return {
+        "message": f"User {username} logged in successfully.",
+        "access_token": create_access_token(username),
+        "token_type": "bearer",
+    }
+
+
+@router.get("/me")
+def me(username: str = Depends(get_current_user)):
+    return {"username": username}
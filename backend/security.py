@@ -0,0 +1,193 @@
+import logging
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+
+from jose import JWTError, jwt
+from passlib.context import CryptContext
+
+logger = logging.getLogger(__name__)
+
+ALGORITHM = "HS256"
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+
+# bcrypt cost is only paid on register/login; rehash on login when the cost changes
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+
+
+class InvalidTokenError(Exception):
+    pass
+
+
+def hash_password(password):
+    return pwd_context.hash(password)
+
+
+@lru_cache(maxsize=1)
+def _dummy_password_hash():
+    return pwd_context.hash(secrets.token_urlsafe(16))
+
+
+def verify_password(password, password_hash):
+    """Return (is_valid, new_hash); new_hash is set when the stored hash is outdated.
+
+    A missing hash (unknown user) is still checked against a throwaway hash so
+    failed logins take the same time whether or not the user exists.
+    """
+    if password_hash is None:
+        pwd_context.verify(password, _dummy_password_hash())
+        return False, None
+    return pwd_context.verify_and_update(password, password_hash)
+
+
+def _load_keys():
+    # JWT_SECRET_KEYS="kid2:secret2,kid1:secret1" — first entry signs, all entries verify
+    raw = os.getenv("JWT_SECRET_KEYS")
+    if raw:
+        pairs = [item.split(":", 1) for item in raw.split(",") if item.strip()]
+        return OrderedDict((kid.strip(), secret.strip()) for kid, secret in pairs)
+    secret = os.getenv("JWT_SECRET_KEY")
+    if not secret:
+        logger.warning(
+            "JWT_SECRET_KEY/JWT_SECRET_KEYS not set; using a random per-process key. "
+            "Tokens will not survive restarts or be accepted across workers."
+        )
+        secret = secrets.token_urlsafe(32)
+    return OrderedDict([("default", secret)])
+
+
+class KeyRing:
+    """Signing keys addressed by `kid`; the first key signs new tokens.
+
+    rotate/retire only change this process. With several workers, rotate by
+    updating JWT_SECRET_KEYS and restarting them.
+    """
+
+    def __init__(self, keys=None):
+        self._keys = keys if keys is not None else _load_keys()
+        self._lock = threading.Lock()
+
+    @property
+    def active_kid(self):
+        return next(iter(self._keys))
+
+    def get(self, kid):
+        return self._keys.get(kid)
+
+    def __contains__(self, kid):
+        return kid in self._keys
+
+    def rotate(self, kid, secret):
+        # New tokens are signed with `kid`; previously issued tokens stay valid until retired
+        with self._lock:
+            keys = OrderedDict([(kid, secret)])
+            keys.update((k, v) for k, v in self._keys.items() if k != kid)
+            self._keys = keys
+
+    def retire(self, kid):
+        with self._lock:
+            if kid == self.active_kid:
+                raise ValueError("Cannot retire the active signing key.")
+            keys = OrderedDict(self._keys)
+            keys.pop(kid, None)
+            self._keys = keys
+
+
+class TokenCache:
+    """Bounded LRU of verified claims so repeat requests skip signature checks."""
+
+    def __init__(self, maxsize=TOKEN_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token, now):
+        entry = self._entries.get(token)
+        if entry is None:
+            return None
+        claims, expires_at, kid, secret = entry
+        with self._lock:
+            if expires_at <= now:
+                self._entries.pop(token, None)
+                return None
+            if token in self._entries:
+                self._entries.move_to_end(token)
+        return claims, kid, secret
+
+    def put(self, token, claims, expires_at, kid, secret):
+        with self._lock:
+            self._entries[token] = (claims, expires_at, kid, secret)
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, token):
+        with self._lock:
+            self._entries.pop(token, None)
+
+    def evict_kid(self, kid):
+        with self._lock:
+            for token in [t for t, entry in self._entries.items() if entry[2] == kid]:
+                del self._entries[token]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+key_ring = KeyRing()
+token_cache = TokenCache()
+
+
+def create_access_token(subject, expires_minutes=ACCESS_TOKEN_EXPIRE_MINUTES):
+    kid = key_ring.active_kid
+    expire = datetime.now(timezone.utc) + timedelta(minutes=expires_minutes)
+    claims = {"sub": subject, "exp": expire}
+    return jwt.encode(claims, key_ring.get(kid), algorithm=ALGORITHM, headers={"kid": kid})
+
+
+def verify_access_token(token):
+    """Return the token claims, using the cache for tokens seen before."""
+    now = time.time()
+    cached = token_cache.get(token, now)
+    if cached is not None:
+        claims, kid, secret = cached
+        if key_ring.get(kid) == secret:
+            return claims
+        # The key was retired or replaced since this token was cached; verify from scratch
+        token_cache.discard(token)
+
+    try:
+        kid = jwt.get_unverified_header(token).get("kid", "default")
+        secret = key_ring.get(kid)
+        if secret is None:
+            raise InvalidTokenError("Unknown signing key.")
+        claims = jwt.decode(token, secret, algorithms=[ALGORITHM])
+    except JWTError as exc:
+        raise InvalidTokenError(str(exc))
+
+    if "sub" not in claims or "exp" not in claims:
+        raise InvalidTokenError("Token is missing required claims.")
+    token_cache.put(token, claims, float(claims["exp"]), kid, secret)
+    return claims
+
+
+def rotate_signing_key(kid, secret=None):
+    # Per-process only; see KeyRing
+    key_ring.rotate(kid, secret or secrets.token_urlsafe(32))
+    # Replacing the secret of an existing kid invalidates tokens cached under it
+    token_cache.evict_kid(kid)
+
+
+def retire_signing_key(kid):
+    key_ring.retire(kid)
+    token_cache.evict_kid(kid)
@@ -0,0 +1,72 @@
+import os
+from collections import OrderedDict
+
+os.environ.setdefault("JWT_SECRET_KEY", "test-secret")
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import security
+import user_store
+from routers import auth
+from security import create_access_token, retire_signing_key, rotate_signing_key, token_cache
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    monkeypatch.setattr(security, "key_ring", security.KeyRing(OrderedDict([("default", "test-secret")])))
+    monkeypatch.setattr(user_store, "_store", user_store.UserStore(str(tmp_path / "users.db"), pool_size=2))
+    token_cache.clear()
+    app = FastAPI()
+    app.include_router(auth.router, prefix="/auth")
+    yield TestClient(app)
+    token_cache.clear()
+
+
+def register(client, username="alice", password="secret"):
+    return client.post("/auth/register", data={"username": username, "password": password})
+
+
+def login(client, username="alice", password="secret"):
+    return client.post("/auth/login", data={"username": username, "password": password})
+
+
+def me(client, token):
+    return client.get("/auth/me", headers={"Authorization": f"Bearer {token}"})
+
+
+def test_register_and_login(client):
+    assert register(client).status_code == 200
+    response = login(client)
+    assert response.status_code == 200
+    assert me(client, response.json()["access_token"]).json() == {"username": "alice"}
+
+
+def test_duplicate_register(client):
+    register(client)
+    assert register(client).status_code == 409
+
+
+def test_credentials_not_accepted_as_query_params(client):
+    response = client.post("/auth/register", params={"username": "alice", "password": "secret"})
+    assert response.status_code == 422
+
+
+def test_login_failures(client):
+    register(client)
+    assert login(client, password="wrong").status_code == 401
+    assert login(client, username="nobody").status_code == 401
+
+
+def test_me_rejects_bad_tokens(client):
+    register(client)
+    assert me(client, create_access_token("alice", expires_minutes=-1)).status_code == 401
+    assert client.get("/auth/me").status_code in (401, 403)
+
+    token = login(client).json()["access_token"]
+    assert me(client, token).status_code == 200
+    rotate_signing_key("k2", "second-secret")
+    retire_signing_key("default")
+    assert me(client, token).status_code == 401
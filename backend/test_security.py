@@ -0,0 +1,111 @@
+import os
+import time
+from collections import OrderedDict
+
+os.environ.setdefault("JWT_SECRET_KEY", "test-secret")
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+import pytest
+
+import security
+from security import (
+    InvalidTokenError,
+    TokenCache,
+    create_access_token,
+    hash_password,
+    retire_signing_key,
+    rotate_signing_key,
+    token_cache,
+    verify_access_token,
+    verify_password,
+)
+from user_store import UserExistsError, UserStore
+
+
+@pytest.fixture(autouse=True)
+def fresh_keys(monkeypatch):
+    monkeypatch.setattr(security, "key_ring", security.KeyRing(OrderedDict([("default", "test-secret")])))
+    token_cache.clear()
+    yield
+    token_cache.clear()
+
+
+def test_token_round_trip_is_cached():
+    token = create_access_token("alice")
+    assert verify_access_token(token)["sub"] == "alice"
+    assert len(token_cache) == 1
+    assert verify_access_token(token)["sub"] == "alice"
+
+
+def test_expired_token_rejected():
+    with pytest.raises(InvalidTokenError):
+        verify_access_token(create_access_token("alice", expires_minutes=-1))
+
+
+def test_cache_entry_expires():
+    cache = TokenCache()
+    cache.put("t", {"sub": "alice"}, time.time() - 1, "default", "s")
+    assert cache.get("t", time.time()) is None
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TokenCache(maxsize=2)
+    expires = time.time() + 60
+    cache.put("a", {}, expires, "default", "s")
+    cache.put("b", {}, expires, "default", "s")
+    cache.get("a", time.time())
+    cache.put("c", {}, expires, "default", "s")
+    assert list(cache._entries) == ["a", "c"]
+
+
+def test_rotation_keeps_old_tokens_until_retired():
+    old = create_access_token("alice")
+    verify_access_token(old)
+    rotate_signing_key("k2", "second-secret")
+    new = create_access_token("bob")
+    assert verify_access_token(new)["sub"] == "bob"
+    assert verify_access_token(old)["sub"] == "alice"
+
+    retire_signing_key("default")
+    with pytest.raises(InvalidTokenError):
+        verify_access_token(old)
+    assert verify_access_token(new)["sub"] == "bob"
+
+
+def test_rotating_existing_kid_drops_cached_tokens():
+    token = create_access_token("alice")
+    verify_access_token(token)
+    rotate_signing_key("default", "replacement-secret")
+    with pytest.raises(InvalidTokenError):
+        verify_access_token(token)
+
+
+def test_active_key_cannot_be_retired():
+    with pytest.raises(ValueError):
+        retire_signing_key("default")
+
+
+def test_tampered_token_rejected():
+    token = create_access_token("alice")
+    with pytest.raises(InvalidTokenError):
+        verify_access_token(token[:-2] + ("AA" if token[-2:] != "AA" else "BB"))
+
+
+def test_password_hashing():
+    password_hash = hash_password("secret")
+    assert verify_password("secret", password_hash)[0]
+    assert not verify_password("wrong", password_hash)[0]
+    assert verify_password("secret", None) == (False, None)
+
+
+def test_user_store(tmp_path):
+    store = UserStore(str(tmp_path / "users.db"), pool_size=2)
+    store.add_user("alice", "hash1")
+    with pytest.raises(UserExistsError):
+        store.add_user("alice", "hash2")
+    assert store.get_password_hash("alice") == "hash1"
+    assert store.get_password_hash("bob") is None
+    store.update_password_hash("alice", "hash3")
+    assert store.get_password_hash("alice") == "hash3"
+    store.close()
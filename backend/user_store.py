@@ -0,0 +1,86 @@
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+DB_PATH = os.getenv("USER_DB_PATH", "users.db")
+POOL_SIZE = int(os.getenv("USER_DB_POOL_SIZE", "4"))
+
+
+class UserExistsError(Exception):
+    pass
+
+
+class UserStore:
+    """Local SQLite user table served from a small pool of reusable connections."""
+
+    def __init__(self, path=DB_PATH, pool_size=POOL_SIZE):
+        self.path = path
+        self._pool = queue.Queue(maxsize=pool_size)
+        # A shared in-memory database only lives as long as one of its connections
+        uri = path.startswith("file:")
+        for _ in range(pool_size):
+            conn = sqlite3.connect(path, uri=uri, check_same_thread=False, timeout=30)
+            conn.row_factory = sqlite3.Row
+            if not uri:
+                conn.execute("PRAGMA journal_mode=WAL")
+            self._pool.put(conn)
+        with self.connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS users (
+                    username TEXT PRIMARY KEY,
+                    password_hash TEXT NOT NULL,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+    @contextmanager
+    def connection(self):
+        conn = self._pool.get()
+        try:
+            with conn:
+                yield conn
+        finally:
+            self._pool.put(conn)
+
+    def add_user(self, username, password_hash):
+        try:
+            with self.connection() as conn:
+                conn.execute(
+                    "INSERT INTO users (username, password_hash) VALUES (?, ?)",
+                    (username, password_hash),
+                )
+        except sqlite3.IntegrityError:
+            raise UserExistsError(username)
+
+    def get_password_hash(self, username):
+        with self.connection() as conn:
+            row = conn.execute(
+                "SELECT password_hash FROM users WHERE username = ?", (username,)
+            ).fetchone()
+        return row["password_hash"] if row else None
+
+    def update_password_hash(self, username, password_hash):
+        with self.connection() as conn:
+            conn.execute(
+                "UPDATE users SET password_hash = ? WHERE username = ?",
+                (password_hash, username),
+            )
+
+    def close(self):
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_user_store():
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = UserStore()
+    return _store
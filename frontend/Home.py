@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 import sys, os
+from modules.profiling import DatasetProfile
 
 # Path setup
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -84,7 +85,12 @@ if uploaded_file:
     missing = all_expected - set(df.columns)
 
     if required_core.issubset(df.columns):
-        st.session_state["installed_base_data"] = df
+        # Store and profile once per upload; page reruns reuse the same frame and summaries
+        upload_key = uploaded_file.file_id
+        if st.session_state.get("installed_base_upload") != upload_key:
+            st.session_state["installed_base_data"] = df
+            st.session_state["installed_base_profile"] = DatasetProfile(df)
+            st.session_state["installed_base_upload"] = upload_key
         st.markdown('<div class="upload-success">✅ Data uploaded successfully.</div>', unsafe_allow_html=True)
         if missing:
             st.warning(f"⚠️ Some optional fields missing: {', '.join(missing)}. Analysis may be limited.")
@@ -0,0 +1,163 @@
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+
+# --- Models ---
+# Each model sees the series as a full array plus a cutoff `t`; the training
+# window is y[:t]. Cutoffs only grow, so incremental models consume y[self.n:t]
+# and keep running statistics instead of refitting from scratch.
+
+class NaiveModel:
+    name = "Naive"
+
+    def update(self, y, t):
+        self.last = y[t - 1]
+
+    def forecast(self, horizon):
+        return np.full(horizon, self.last)
+
+
+class MeanModel:
+    name = "Historical Mean"
+
+    def __init__(self):
+        self.n = 0
+        self.total = 0.0
+
+    def update(self, y, t):
+        self.total += y[self.n:t].sum()
+        self.n = t
+
+    def forecast(self, horizon):
+        return np.full(horizon, self.total / self.n)
+
+
+class LinearTrendModel:
+    """Least-squares trend on the month index, kept as running sums."""
+    name = "Linear Trend"
+
+    def __init__(self):
+        self.n = 0
+        self.sx = self.sy = self.sxx = self.sxy = 0.0
+
+    def update(self, y, t):
+        x = np.arange(self.n, t, dtype=float)
+        new = y[self.n:t]
+        self.sx += x.sum()
+        self.sy += new.sum()
+        self.sxx += (x * x).sum()
+        self.sxy += (x * new).sum()
+        self.n = t
+
+    def forecast(self, horizon):
+        denom = self.n * self.sxx - self.sx ** 2
+        slope = (self.n * self.sxy - self.sx * self.sy) / denom if denom else 0.0
+        intercept = (self.sy - slope * self.sx) / self.n
+        x = np.arange(self.n, self.n + horizon, dtype=float)
+        return intercept + slope * x
+
+
+class SeasonalNaiveModel:
+    name = "Seasonal Naive"
+    season = 12
+
+    def update(self, y, t):
+        # Falls back to the last value until a full season is available
+        self.window = y[max(t - self.season, 0):t]
+
+    def forecast(self, horizon):
+        if len(self.window) < self.season:
+            return np.full(horizon, self.window[-1])
+        return self.window[np.arange(horizon) % self.season]
+
+
+MODELS = {model.name: model for model in [NaiveModel, MeanModel, LinearTrendModel, SeasonalNaiveModel]}
+
+# --- Data Preparation ---
+
+TOTAL_SEGMENT = "All"
+
+def build_series(data, date_col="Date", value_col="Revenue", segment_col=None):
+    """Monthly totals as float arrays.
+
+    The overall total is keyed TOTAL_SEGMENT and each segment
+    "<segment_col>=<value>", so no segment value can overwrite the total.
+    """
+    monthly = data.assign(Month=data[date_col].dt.to_period("M"))
+    months = pd.period_range(monthly["Month"].min(), monthly["Month"].max(), freq="M")
+
+    series = {TOTAL_SEGMENT: monthly.groupby("Month")[value_col].sum().reindex(months, fill_value=0).to_numpy(float)}
+    if segment_col:
+        grouped = monthly.groupby([segment_col, "Month"])[value_col].sum()
+        for segment, values in grouped.groupby(level=0):
+            series[f"{segment_col}={segment}"] = values.droplevel(0).reindex(months, fill_value=0).to_numpy(float)
+    return series
+
+
+def expanding_cutoffs(n, min_train, step=1):
+    """Cutoffs t for folds train=y[:t], test=y[t:t+h]; windows are array views."""
+    if min_train < 1:
+        raise ValueError("min_train must be at least 1.")
+    return list(range(min_train, n, step))
+
+# --- Backtest Engine ---
+
+def _backtest_one(task):
+    segment, model_name, y, cutoffs, max_horizon = task
+    model = MODELS[model_name]()
+    count = np.zeros(max_horizon)
+    abs_err = np.zeros(max_horizon)
+    sq_err = np.zeros(max_horizon)
+    pct_err = np.zeros(max_horizon)
+    pct_count = np.zeros(max_horizon)
+
+    for t in cutoffs:
+        model.update(y, t)
+        h = min(max_horizon, len(y) - t)
+        err = y[t:t + h] - model.forecast(h)
+        actual = y[t:t + h]
+        count[:h] += 1
+        abs_err[:h] += np.abs(err)
+        sq_err[:h] += err ** 2
+        nonzero = actual != 0
+        pct_err[:h] += np.where(nonzero, np.abs(err) / np.where(nonzero, np.abs(actual), 1), 0)
+        pct_count[:h] += nonzero
+
+    rows = []
+    for h in range(max_horizon):
+        if count[h]:
+            rows.append({
+                "Model": model_name,
+                "Segment": segment,
+                "Horizon": h + 1,
+                "Folds": int(count[h]),
+                "MAE": abs_err[h] / count[h],
+                "RMSE": np.sqrt(sq_err[h] / count[h]),
+                "MAPE %": 100 * pct_err[h] / pct_count[h] if pct_count[h] else np.nan,
+            })
+    return rows
+
+
+def run_backtest(series, models=None, max_horizon=6, min_train=6, step=1, n_jobs=None):
+    """Rolling-origin backtest of every model on every series.
+
+    One task per (segment, model) walks all cutoffs so incremental models
+    reuse their statistics; tasks are spread across a process pool. Pass
+    n_jobs=1 from interactive pages, where pool startup outweighs the work.
+    """
+    models = models or list(MODELS)
+    tasks = []
+    for segment, y in series.items():
+        cutoffs = expanding_cutoffs(len(y), min_train, step)
+        if cutoffs:
+            tasks.extend((segment, name, y, cutoffs, max_horizon) for name in models)
+
+    if n_jobs == 1 or len(tasks) <= 1:
+        results = map(_backtest_one, tasks)
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            results = list(pool.map(_backtest_one, tasks, chunksize=max(1, len(tasks) // 32)))
+
+    rows = [row for task_rows in results for row in task_rows]
+    columns = ["Model", "Segment", "Horizon", "Folds", "MAE", "RMSE", "MAPE %"]
+    return pd.DataFrame(rows, columns=columns).sort_values(["Segment", "Horizon", "RMSE"]).reset_index(drop=True)
@@ -6,6 +6,14 @@ from sklearn.metrics import mean_squared_error
 import numpy as np
 import io
 from datetime import datetime
+from modules.backtesting import TOTAL_SEGMENT, build_series, run_backtest
+
+@st.cache_data(show_spinner=False)
+def cached_backtest(merged, segment_col, max_horizon, min_train):
+    # Serial on purpose: a process pool is slower at page scale and forking a
+    # multithreaded Streamlit server can deadlock
+    series = build_series(merged, segment_col=segment_col)
+    return run_backtest(series, max_horizon=max_horizon, min_train=min_train, n_jobs=1)
 
 def render_forecasting():
     st.title("📈 Aftermarket Revenue Forecasting")
@@ -93,7 +101,27 @@ def render_forecasting():
         # Error metric display
         predictions = model.predict(X)
         rmse = np.sqrt(mean_squared_error(y, predictions))
-        st.metric(label="Model RMSE", value=f"${rmse:,.2f}")
+        st.metric(label="Model RMSE (in-sample)", value=f"${rmse:,.2f}")
+
+        # Rolling-origin backtest for out-of-sample model comparison
+        with st.expander("🧪 Backtest Models"):
+            segment_options = ["None"] + [c for c in merged.select_dtypes(include="object").columns
+                                          if c != "Equipment ID"]
+            segment_col = st.selectbox("Segment By", segment_options)
+            max_horizon = st.slider("Max Horizon (Months)", 1, 12, 6)
+            min_train = st.slider("Minimum Training Months", 2, 24, 6)
+
+            backtest = cached_backtest(merged, None if segment_col == "None" else segment_col,
+                                       max_horizon, min_train)
+
+            if backtest.empty:
+                st.warning("Not enough history for the selected minimum training window.")
+            else:
+                st.dataframe(backtest, use_container_width=True)
+                summary = backtest[backtest["Segment"] == TOTAL_SEGMENT]
+                fig4 = px.line(summary, x="Horizon", y="RMSE", color="Model", markers=True,
+                               title="Out-of-Sample RMSE by Horizon (All Segments)")
+                st.plotly_chart(fig4, use_container_width=True)
 
         # Export forecast
         st.download_button(
@@ -6,6 +6,7 @@ from sklearn.ensemble import RandomForestClassifier, IsolationForest
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report
 from scipy import stats
+from modules.profiling import get_profile
 
 # --- Helper Functions ---
 
@@ -23,14 +24,18 @@ def detect_outliers_iqr(df, column):
     IQR = Q3 - Q1
     return (df[column] < Q1 - 1.5 * IQR) | (df[column] > Q3 + 1.5 * IQR)
 
-def industry_profile(data):
+def industry_profile(data, profile):
     st.subheader("🏭 Industry Detection & Profile")
-    industry = data["Application"].mode()[0] if "Application" in data.columns else "General"
+    if "Application" in profile.value_counts:
+        industry = profile.mode("Application")
+    else:
+        # Too many distinct values to keep counts for; scan the column instead
+        industry = data["Application"].mode()[0] if "Application" in data.columns else "General"
     st.markdown(f"**Detected Industry**: `{industry}` based on dominant application type")
     return industry
 
-def predict_maintenance(data):
-    threshold = data["Usage Hours"].quantile(0.95)
+def predict_maintenance(data, profile):
+    threshold = profile.quantile("Usage Hours", 0.95)
     data['Needs Maintenance'] = data['Usage Hours'] > threshold
     return data
 
@@ -111,13 +116,21 @@ def render_installed_base():
         st.error("Missing columns: " + ", ".join([c for c in required if c not in data.columns]))
         return
 
-    industry = industry_profile(data)
-    data = predict_maintenance(data)
+    profile = get_profile(data)
+    # Derived columns go on a copy so they don't leak into the stored upload
+    data = data.copy()
+    industry = industry_profile(data, profile)
+    data = predict_maintenance(data, profile)
 
     # Equipment Overview
     with st.expander("📊 Equipment Overview"):
-        st.plotly_chart(px.histogram(data, x="Usage Hours"))
-        st.plotly_chart(px.pie(data, names="Service History", title="Service Distribution"))
+        usage_hist = profile.histogram("Usage Hours")
+        st.plotly_chart(px.bar(usage_hist, x="Usage Hours", y="count").update_layout(bargap=0))
+        if "Service History" in profile.value_counts:
+            service_counts = profile.counts("Service History")
+        else:
+            service_counts = data["Service History"].value_counts()
+        st.plotly_chart(px.pie(names=service_counts.index, values=service_counts.values, title="Service Distribution"))
         #st.plotly_chart(px.bar(data["Location"].value_counts().reset_index(),x=data.index, y="Location", title="Units per Location"))
 
     # Entitlement Estimation
@@ -126,7 +139,7 @@ def render_installed_base():
         if method == "Kaplan-Meier":
             data = run_kaplan_meier(data)
         else:
-            median = data["Usage Hours"].median() * 1.2
+            median = profile.median("Usage Hours") * 1.2
             data["Entitled Usage"] = median
             st.metric("Statistical Entitlement", f"{median:.0f} hrs")
 
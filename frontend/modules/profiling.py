@@ -0,0 +1,165 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+MAX_SEGMENTS = 50
+MAX_DISTINCT_VALUES = 1000
+HISTOGRAM_BINS = 30
+
+
+class DatasetProfile:
+    """Summary statistics computed once per dataset and updated on append.
+
+    Numeric columns keep their sorted values (quantiles are an index lookup and
+    match pandas' linear interpolation), running moments and pairwise
+    cross-product sums for correlations, taken around a per-column reference
+    value so large offsets do not cancel out. Columns with at most
+    MAX_DISTINCT_VALUES distinct values keep value counts, and low-cardinality
+    text columns keep per-segment aggregates of the numeric ones.
+    """
+
+    def __init__(self, data):
+        # Identifies the frame this profile describes; see get_profile
+        self.source = id(data)
+        self.numeric = [c for c in data.columns
+                        if pd.api.types.is_numeric_dtype(data[c]) and not pd.api.types.is_bool_dtype(data[c])]
+        self.columns = list(data.columns)
+        self.rows = 0
+        # IDs and continuous values would cost a count per row; they are left out
+        self.value_counts = {c: pd.Series(dtype="int64") for c in self.columns
+                             if data[c].nunique() <= MAX_DISTINCT_VALUES}
+        self.nulls = dict.fromkeys(self.columns, 0)
+        self.sorted_values = {c: np.empty(0) for c in self.numeric}
+        k = len(self.numeric)
+        self._pair_n = np.zeros((k, k))
+        self._pair_sx = np.zeros((k, k))
+        self._pair_sxx = np.zeros((k, k))
+        self._pair_sxy = np.zeros((k, k))
+        self._reference = data[self.numeric].mean().fillna(0).to_numpy(float)
+        # Segment aggregates summarise numeric columns, so there is nothing to keep without any
+        self.segment_columns = [c for c in self.columns
+                                if self.numeric and c not in self.numeric and data[c].nunique() <= MAX_SEGMENTS]
+        self.segments = {}
+        self._cache = {}
+        self.update(data)
+
+    # --- Incremental Updates ---
+
+    def update(self, rows):
+        """Fold appended rows into the profile without rescanning earlier data."""
+        self._cache.clear()
+        self.rows += len(rows)
+
+        for col in self.columns:
+            values = rows[col] if col in rows.columns else pd.Series(np.nan, index=rows.index)
+            self.nulls[col] += int(values.isna().sum())
+            if col in self.value_counts:
+                counts = self.value_counts[col].add(values.value_counts(), fill_value=0).astype("int64")
+                if len(counts) > MAX_DISTINCT_VALUES:
+                    del self.value_counts[col]
+                else:
+                    self.value_counts[col] = counts
+
+        numeric = rows.reindex(columns=self.numeric).apply(pd.to_numeric, errors="coerce")
+        for col in self.numeric:
+            new = np.sort(numeric[col].dropna().to_numpy(float))
+            old = self.sorted_values[col]
+            self.sorted_values[col] = np.insert(old, np.searchsorted(old, new), new)
+
+        # Pairwise-complete sums, as used by DataFrame.corr()
+        present = numeric.notna().to_numpy(float)
+        x = (numeric - self._reference).fillna(0).to_numpy(float)
+        self._pair_n += present.T @ present
+        self._pair_sx += x.T @ present
+        self._pair_sxx += (x * x).T @ present
+        self._pair_sxy += x.T @ x
+
+        for seg_col in list(self.segment_columns):
+            if seg_col not in rows.columns:
+                continue
+            agg = numeric.groupby(rows[seg_col]).agg(["count", "sum", "min", "max"])
+            merged = agg if seg_col not in self.segments else pd.concat([self.segments[seg_col], agg])
+            if merged.index.nunique() > MAX_SEGMENTS:
+                self.segment_columns.remove(seg_col)
+                self.segments.pop(seg_col, None)
+                continue
+            ops = {column: "sum" if column[1] in ("count", "sum") else column[1] for column in merged.columns}
+            self.segments[seg_col] = merged.groupby(level=0).agg(ops)
+
+    # --- Summary Reads ---
+
+    def mode(self, col):
+        counts = self.value_counts[col]
+        if counts.empty:
+            return None
+        tied = counts.index[counts == counts.max()]
+        # Same tie-break as Series.mode()[0], which also copes with mixed types
+        return pd.Series(tied, dtype=object).mode()[0]
+
+    def quantile(self, col, q):
+        values = self.sorted_values[col]
+        if not len(values):
+            return np.nan
+        pos = q * (len(values) - 1)
+        lo = int(np.floor(pos))
+        hi = min(lo + 1, len(values) - 1)
+        return values[lo] + (values[hi] - values[lo]) * (pos - lo)
+
+    def median(self, col):
+        return self.quantile(col, 0.5)
+
+    def counts(self, col):
+        """Value counts as a Series, most frequent first."""
+        key = ("counts", col)
+        if key not in self._cache:
+            self._cache[key] = self.value_counts[col].rename("count").sort_values(ascending=False)
+        return self._cache[key]
+
+    def histogram(self, col, bins=HISTOGRAM_BINS):
+        """Bin centers and counts for a numeric column."""
+        key = ("histogram", col, bins)
+        if key not in self._cache:
+            counts, edges = np.histogram(self.sorted_values[col], bins=bins)
+            self._cache[key] = pd.DataFrame({col: (edges[:-1] + edges[1:]) / 2, "count": counts})
+        return self._cache[key]
+
+    def correlation(self):
+        if "correlation" not in self._cache:
+            n = self._pair_n
+            with np.errstate(divide="ignore", invalid="ignore"):
+                cov = n * self._pair_sxy - self._pair_sx * self._pair_sx.T
+                var = n * self._pair_sxx - self._pair_sx ** 2
+                corr = cov / np.sqrt(var * var.T)
+            corr[n < 2] = np.nan
+            self._cache["correlation"] = pd.DataFrame(corr.clip(-1, 1), index=self.numeric, columns=self.numeric)
+        return self._cache["correlation"]
+
+    def segment_summary(self, seg_col):
+        """Per-segment count, sum, mean, min and max of each numeric column."""
+        key = ("segments", seg_col)
+        if key not in self._cache:
+            summary = self.segments[seg_col].copy()
+            for col in self.numeric:
+                summary[(col, "mean")] = summary[(col, "sum")] / summary[(col, "count")]
+            self._cache[key] = summary.sort_index(axis=1)
+        return self._cache[key]
+
+
+def get_profile(data, key="installed_base_profile"):
+    """Profile stored alongside `data` in the session, rebuilt if it describes another frame."""
+    profile = st.session_state.get(key)
+    if profile is None or profile.source != id(data) or profile.rows != len(data):
+        profile = DatasetProfile(data)
+        st.session_state[key] = profile
+    return profile
+
+
+def append_rows(rows, data_key="installed_base_data", profile_key="installed_base_profile"):
+    """Append rows to a session dataset and fold them into its profile."""
+    data = pd.concat([st.session_state[data_key], rows], ignore_index=True)
+    profile = st.session_state.get(profile_key)
+    if profile is not None:
+        profile.update(rows)
+        profile.source = id(data)
+    st.session_state[data_key] = data
+    return data
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.backtesting import (
+    MODELS,
+    TOTAL_SEGMENT,
+    LinearTrendModel,
+    MeanModel,
+    build_series,
+    expanding_cutoffs,
+    run_backtest,
+)
+
+
+@pytest.fixture
+def revenue():
+    rng = np.random.default_rng(0)
+    months = pd.date_range("2020-01-01", periods=36, freq="MS")
+    return pd.DataFrame({
+        "Date": rng.choice(months, 600),
+        "Revenue": rng.gamma(2, 100, 600),
+        "Application": rng.choice(["Mining", "Oil", "Water"], 600),
+    })
+
+
+def test_build_series_per_segment(revenue):
+    series = build_series(revenue, segment_col="Application")
+    assert set(series) == {TOTAL_SEGMENT, "Application=Mining", "Application=Oil", "Application=Water"}
+    assert len(series[TOTAL_SEGMENT]) == 36
+    segments = [series[key] for key in series if key != TOTAL_SEGMENT]
+    np.testing.assert_allclose(series[TOTAL_SEGMENT], np.sum(segments, axis=0))
+
+
+def test_segment_named_all_keeps_total(revenue):
+    revenue["Application"] = revenue["Application"].replace("Oil", "All")
+    series = build_series(revenue, segment_col="Application")
+    assert series[TOTAL_SEGMENT].sum() == pytest.approx(revenue["Revenue"].sum())
+    assert series["Application=All"].sum() == pytest.approx(revenue.loc[revenue["Application"] == "All", "Revenue"].sum())
+
+
+def test_incremental_models_match_full_refit():
+    y = np.random.default_rng(1).normal(1000, 50, 40)
+    trend, mean = LinearTrendModel(), MeanModel()
+    for t in expanding_cutoffs(len(y), 3):
+        trend.update(y, t)
+        mean.update(y, t)
+        expected = np.polyval(np.polyfit(np.arange(t), y[:t], 1), np.arange(t, t + 4))
+        np.testing.assert_allclose(trend.forecast(4), expected)
+        np.testing.assert_allclose(mean.forecast(4), np.full(4, y[:t].mean()))
+
+
+def test_backtest_table(revenue):
+    series = build_series(revenue, segment_col="Application")
+    table = run_backtest(series, max_horizon=3, min_train=12, n_jobs=1)
+    assert len(table) == len(series) * len(MODELS) * 3
+    assert table["Folds"].max() == 36 - 12
+    assert not table[["MAE", "RMSE"]].isna().any().any()
+
+
+def test_pool_matches_serial(revenue):
+    series = build_series(revenue, segment_col="Application")
+    serial = run_backtest(series, max_horizon=3, min_train=12, n_jobs=1)
+    pooled = run_backtest(series, max_horizon=3, min_train=12, n_jobs=2)
+    pd.testing.assert_frame_equal(serial, pooled)
+
+
+def test_min_train_must_be_positive(revenue):
+    with pytest.raises(ValueError):
+        run_backtest(build_series(revenue), min_train=0)
@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules import profiling
+from modules.profiling import MAX_DISTINCT_VALUES, DatasetProfile, get_profile
+
+
+@pytest.fixture
+def installed_base():
+    rng = np.random.default_rng(0)
+    n = 500
+    usage = rng.gamma(3, 2000, n)
+    data = pd.DataFrame({
+        "Equipment ID": [f"EQ{i:04d}" for i in range(n)],
+        "Location": rng.choice(["North", "South", "East", "West"], n),
+        "Application": rng.choice(["Mining", "Oil", "Water"], n),
+        "Usage Hours": usage,
+        "Pressure": usage * 0.01 + rng.normal(0, 5, n),
+        "Speed": rng.integers(500, 3000, n),
+    })
+    data.loc[::17, "Pressure"] = np.nan
+    return data
+
+
+def test_update_matches_full_scan(installed_base):
+    profile = DatasetProfile(installed_base.iloc[:200])
+    profile.update(installed_base.iloc[200:350])
+    profile.update(installed_base.iloc[350:])
+
+    assert profile.rows == len(installed_base)
+    assert profile.mode("Application") == installed_base["Application"].mode()[0]
+    for col in profile.numeric:
+        assert profile.quantile(col, 0.95) == pytest.approx(installed_base[col].quantile(0.95))
+        assert profile.median(col) == pytest.approx(installed_base[col].median())
+    pd.testing.assert_frame_equal(profile.correlation(), installed_base[profile.numeric].corr())
+    assert profile.counts("Location").to_dict() == installed_base["Location"].value_counts().to_dict()
+
+    summary = profile.segment_summary("Location")["Usage Hours"]
+    expected = installed_base.groupby("Location")["Usage Hours"].agg(["count", "sum", "min", "max", "mean"])
+    np.testing.assert_allclose(summary[expected.columns].to_numpy(float), expected.to_numpy(float))
+
+
+def test_correlation_with_large_offset():
+    rng = np.random.default_rng(0)
+    a = 1e8 + rng.normal(0, 1, 10_000)
+    data = pd.DataFrame({"a": a, "c": a + 0.1 * rng.normal(0, 1, 10_000)})
+
+    profile = DatasetProfile(data.iloc[:4_000])
+    profile.update(data.iloc[4_000:])
+    pd.testing.assert_frame_equal(profile.correlation(), data.corr(), atol=1e-6)
+
+
+def test_no_numeric_columns():
+    data = pd.DataFrame({"Usage Hours": ["1,200", "3,400", "1,200"], "Location": ["North", "South", "North"]})
+    profile = DatasetProfile(data)
+    assert profile.numeric == []
+    assert profile.segments == {}
+    assert profile.mode("Usage Hours") == "1,200"
+
+
+def test_mode_with_mixed_types():
+    data = pd.DataFrame({"Code": [1, "a", "a", 1]})
+    assert DatasetProfile(data).mode("Code") == data["Code"].mode()[0]
+
+
+def test_value_counts_skip_high_cardinality(installed_base):
+    profile = DatasetProfile(installed_base)
+    assert "Location" in profile.value_counts
+    assert "Equipment ID" in profile.value_counts  # 500 ids, under the limit
+    assert "Usage Hours" in profile.value_counts
+
+    many = pd.DataFrame({"Equipment ID": [f"X{i}" for i in range(MAX_DISTINCT_VALUES + 1)]})
+    profile.update(many.reindex(columns=installed_base.columns))
+    assert "Equipment ID" not in profile.value_counts
+    assert "Location" in profile.value_counts
+    assert DatasetProfile(many).value_counts == {}
+
+
+def test_get_profile_rebuilds_for_other_frame(monkeypatch, installed_base):
+    monkeypatch.setattr(profiling.st, "session_state", {})
+    first = get_profile(installed_base)
+    assert get_profile(installed_base) is first
+
+    other = installed_base.assign(**{"Usage Hours": installed_base["Usage Hours"] * 2})
+    second = get_profile(other)
+    assert second is not first
+    assert second.median("Usage Hours") == pytest.approx(other["Usage Hours"].median())